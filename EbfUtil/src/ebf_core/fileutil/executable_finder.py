@@ -145,14 +145,16 @@ def find_start_menu_shortcut(vendor_folders: Sequence[str], patterns: Sequence[s
             if not search_root.exists():
                 continue
 
-            for lnk_path in search_root.rglob("*.lnk"):
-                name_cf = lnk_path.name.casefold()
-                matched_pattern = next(
-                    (pat for pat in lowered_patterns if fnmatch.fnmatch(name_cf, pat)),
-                    None,
-                )
-                if matched_pattern:
-                    candidates.append(_ShortcutCandidate(lnk_path, matched_pattern, root_rank))
+            for dirpath, _, filenames in os.walk(search_root):
+                # casefolded name → on-disk name; fnmatch.filter matches a whole folder per (cached) pattern
+                shortcuts = {n.casefold(): n for n in filenames if n.casefold().endswith(".lnk")}
+                for pat in lowered_patterns:
+                    if not shortcuts:
+                        break
+                    for name_cf in fnmatch.filter(shortcuts, pat):
+                        # the first pattern to match a file claims it, same as the original per-file scan
+                        lnk_path = Path(dirpath, shortcuts.pop(name_cf))
+                        candidates.append(_ShortcutCandidate(lnk_path, pat, root_rank))
 
     if not candidates:
         return None
@@ -5,6 +5,8 @@ from pathlib import Path
 
 from ebf_core.miscutil.string_helpers import is_str_valued
 
+_SEPS = os.sep + (os.altsep or "")
+
 
 def norm_path(
         value: str | os.PathLike[str] | None,
@@ -119,24 +121,17 @@ def norm_path(
     if expand_env:
         s = os.path.expandvars(s)
 
-    p = Path(s)
-
     # Step 2: Expand tilde to the home directory
-    if expand_user:
-        if home is not None:
-            # Custom home: manually replace ~ (but not ~username)
-            if str(p).startswith("~"):
-                parts = p.parts
-                if parts[0] == "~":
-                    # Simple ~ → replace with custom home
-                    p = Path(home, *parts[1:])
-                elif parts[0].startswith("~"):
-                    # ~username → fall back to standard system expansion
-                    # (can't easily override for other users)
-                    p = p.expanduser()
+    if expand_user and s.startswith("~"):
+        if s == "~" or s[1] in _SEPS:
+            # Simple ~ → splice the home in directly (custom or system), no expanduser re-parse
+            p = Path(home if home is not None else Path.home(), s[1:].lstrip(_SEPS))
         else:
-            # Standard expansion using system home
-            p = p.expanduser()
+            # ~username → fall back to standard system expansion
+            # (can't easily override for other users)
+            p = Path(s).expanduser()
+    else:
+        p = Path(s)
 
     # Step 3: Resolve relative paths against base
     if not p.is_absolute() and base is not None:
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass, replace
-from itertools import count
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Optional, Iterable, List, ClassVar, Self
 
@@ -13,6 +16,25 @@ logger = logging.getLogger(__name__)
 
 _USE_CLASS_DEFAULT = object()  # module-level sentinel (see with_sticky_project_file)
 
+# Set to "1" to list the ancestors concurrently during the marker search (helps on network drives)
+PARALLEL_ROOT_SEARCH_ENV = "EBF_PARALLEL_ROOT_SEARCH"
+
+_scan_pool_instance: Optional[ThreadPoolExecutor] = None
+_scan_pool_lock = threading.Lock()
+
+# Guards every locator's _file_cache: locators are shared across threads, and move_to_end/popitem
+# are not safe to interleave. Module level so that locators stay copyable and picklable.
+_file_cache_lock = threading.Lock()
+
+
+def _scan_pool() -> ThreadPoolExecutor:
+    """Lazily create the shared thread pool used by the parallel marker search."""
+    global _scan_pool_instance
+    with _scan_pool_lock:
+        if _scan_pool_instance is None:
+            _scan_pool_instance = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ebf-root-search")
+        return _scan_pool_instance
+
 
 @dataclass(frozen=True)
 class ProjectFileLocator:
@@ -58,6 +80,7 @@ class ProjectFileLocator:
     DEFAULT_PROJECT_FILE_RELATIVE_PATH: ClassVar[str] = "resources/config.yaml"
     UNLIMITED_DEPTH: ClassVar[int] = -1
     MAX_SEARCH_DEPTH_DEFAULT: ClassVar[int] = 5
+    PROJECT_FILE_CACHE_SIZE: ClassVar[int] = 16
     # endregion
 
     # region Instance configuration (value fields)
@@ -66,6 +89,16 @@ class ProjectFileLocator:
     _priority_marker: Optional[str] = None
     _project_file_relpath: Optional[Path] = None
 
+    # Marker search results keyed by (cwd, max_search_depth); builders start with an empty cache
+    _root_cache: dict[tuple[str, int], Path] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    # get_project_file resolutions keyed by (root, path, is_per_call), least recently used first
+    _file_cache: OrderedDict[tuple[str, str, bool], tuple[Path, bool]] = field(
+        default_factory=OrderedDict, init=False, repr=False, compare=False
+    )
+
     # endregion
 
     # region Builder methods (return new instances)
@@ -79,7 +112,9 @@ class ProjectFileLocator:
 
         Args:
             root: Absolute or relative path to use as the project root, or None to clear.
-                  Relative paths are resolved against CWD.
+                  Relative paths are made absolute against CWD. Paths are only
+                  normalized lexically unless they contain '..' or are themselves a
+                  symlink, in which case they are fully resolved.
 
         Returns:
             New ProjectFileLocator instance with updated root
@@ -97,8 +132,9 @@ class ProjectFileLocator:
         Note:
             This does NOT mutate the instance - a new instance is returned.
         """
-        new_root = None if root is None else Path(root).resolve()
-        return replace(self, _project_root=new_root)
+        if root is None:
+            return replace(self, _project_root=None)
+        return replace(self, _project_root=self._normalize_root(root))
 
     def with_cwd_project_root(self) -> Self:
         """
@@ -215,7 +251,7 @@ class ProjectFileLocator:
 
     # region Query methods
 
-    def get_project_root(self, *, max_search_depth: int = MAX_SEARCH_DEPTH_DEFAULT,) -> Path:
+    def get_project_root(self, *, max_search_depth: int = MAX_SEARCH_DEPTH_DEFAULT, use_cache: bool = True) -> Path:
         """
         Get the project root directory.
 
@@ -232,9 +268,11 @@ class ProjectFileLocator:
         Args:
             max_search_depth: Maximum parent levels to ascend during marker search.
                              Use UNLIMITED_DEPTH (-1) for no limit.
+            use_cache: If True, reuse the result of an earlier marker search made by
+                       this instance from the same CWD with the same depth.
 
         Returns:
-            Absolute resolved Path to the project root
+            Absolute Path to the project root (resolved when found by marker search)
 
         Examples:
             >>> # Auto-detection from CWD
@@ -254,6 +292,10 @@ class ProjectFileLocator:
         Note:
             Marker validation occurs at search time, not during with_markers().
             This allows you to configure markers without triggering immediate validation.
+
+            Search results are cached per instance. Markers created after the first
+            search are not seen by that instance; pass use_cache=False (or build a new
+            locator) to search again.
         """
         if self._project_root is not None:
             logger.debug("Returning user provided project root")
@@ -262,41 +304,53 @@ class ProjectFileLocator:
         markers = self._effective_markers()
         self._validate_markers(markers)
 
+        # Built per search from the same markers the loop walks, so a patched DEFAULT_MARKERS is seen
+        # by locators built before the patch; this is cheap next to a single directory listing.
+        marker_names = frozenset(os.path.normcase(m) for m in markers if not self._is_nested_marker(m))
+        has_nested_markers = any(self._is_nested_marker(m) for m in markers)
+
+        cache_key = (os.getcwd(), max_search_depth)
+        if use_cache and cache_key in self._root_cache:
+            cached = self._root_cache[cache_key]
+            logger.debug("Returning cached project root %s", cached)
+            return cached
+
         start = self._detect_start_path()
         logger.debug("Starting marker search for project root from %s", start)
 
-        current = start
-        found: Optional[Path] = None
+        # Walk on plain strings; only the result is turned back into a Path.
+        # start is already resolved, so its ancestors need no further resolve()
+        ancestors = self._ancestors(os.fspath(start), max_search_depth)
+        found: Optional[str] = None
 
-        depth_iter = (
-            count() if max_search_depth == self.UNLIMITED_DEPTH
-            else range(max_search_depth)
-        )
+        # Listings are consumed in ancestor order, so the nearest match still wins
+        # (and logs) exactly as in the sequential walk
+        if len(ancestors) > 2 and os.environ.get(PARALLEL_ROOT_SEARCH_ENV) == "1":
+            listings = _scan_pool().map(self._entry_names, ancestors)
+        else:
+            listings = map(self._entry_names, ancestors)
 
-        for _ in depth_iter:
+        for current, names in zip(ancestors, listings):
             # Priority marker first
-            if self._priority_marker and (current / self._priority_marker).exists():
-                found = current.resolve()
+            if self._priority_marker and self._has_marker(current, names, self._priority_marker):
+                found = current
                 logger.debug("Found priority marker '%s' at %s", self._priority_marker, found)
                 break
 
-            # Any marker
-            for m in markers:
-                if (current / m).exists():
-                    found = current.resolve()
-                    logger.debug("Found marker '%s' at %s", m, found)
-                    break
+            # Any marker; the set check skips directories without a hit, list order picks among hits
+            if has_nested_markers or not names.isdisjoint(marker_names):
+                for m in markers:
+                    if self._has_marker(current, names, m):
+                        found = current
+                        logger.debug("Found marker '%s' at %s", m, found)
+                        break
 
             if found:
                 break
 
-            parent = current.parent
-            if parent == current:  # Reached filesystem root
-                break
-            current = parent
-
         # Fallback if nothing matched: use start (predictable behavior)
-        result = (found or start).resolve()
+        result = Path(found) if found else start
+        self._root_cache[cache_key] = result
         return result
 
     def get_project_file(
@@ -305,6 +359,7 @@ class ProjectFileLocator:
             *,
             must_exist: bool = True,
             restrict_to_root: bool = True,
+            use_cache: bool = True,
     ) -> Optional[Path]:
         """
         Resolve a project file path.
@@ -325,8 +380,12 @@ class ProjectFileLocator:
                     - Relative: resolved under project root
                     - Absolute: used directly (e.g., ~/config.yaml)
                     - None: use sticky default (if set)
-            must_exist: If True, raise FileNotFoundError if the file doesn't exist
+            must_exist: If True, raise FileNotFoundError if the file doesn't exist.
+                        An absolute path to a dangling symlink counts as existing.
             restrict_to_root: If True, prevent relative paths from escaping the project root via navigation using '..'
+            use_cache: If True, reuse this instance's earlier resolution of the same path under the
+                       same root. Paths with env vars or ~ are never cached. The root restriction
+                       and existence checks run on every call either way.
 
         Returns:
             Absolute resolved Path to the project file, or None if no path is configured
@@ -380,25 +439,44 @@ class ProjectFileLocator:
         # Get project root
         root = self.get_project_root()
 
-        # Check if the source is already absolute (before norm_path processing)
-        # This matters for restrict_to_root logic
-        source_is_absolute = Path(source_path).expanduser().is_absolute()
-
-        # Use norm_path to handle all expansion and resolution
-        # For sticky paths: no tilde expansion allowed (already validated)
-        # For per-call paths: full expansion enabled
-        path = norm_path(
-            source_path,
-            base=root,
-            expand_user=is_per_call,  # Only per-call can use ~
-            expand_env=True,
-        )
+        cache_key = (os.fspath(root), os.fspath(source_path), is_per_call)
+        cacheable = use_cache and not self._is_volatile_path(cache_key[1])
+        cached = None
+        if cacheable:
+            with _file_cache_lock:
+                cached = self._file_cache.get(cache_key)
+                if cached is not None:
+                    self._file_cache.move_to_end(cache_key)
+        if cached is not None:
+            path, source_is_absolute = cached
+            logger.debug("Reusing cached resolution of %s", cache_key[1])
+        else:
+            # Check if the source is already absolute (before norm_path processing)
+            # This matters for restrict_to_root logic
+            source_is_absolute = Path(source_path).expanduser().is_absolute()
+
+            # Use norm_path to handle all expansion and resolution
+            # For sticky paths: no tilde expansion allowed (already validated)
+            # For per-call paths: full expansion enabled
+            path = norm_path(
+                source_path,
+                base=root,
+                expand_user=is_per_call,  # Only per-call can use ~
+                expand_env=True,
+            )
+            if cacheable:
+                with _file_cache_lock:
+                    self._file_cache[cache_key] = (path, source_is_absolute)
+                    if len(self._file_cache) > self.PROJECT_FILE_CACHE_SIZE:
+                        self._file_cache.popitem(last=False)
 
         # Validate that the path is under root if required
         # Note: restrict_to_root only applies to relative paths that were resolved
         # under the project root. Absolute paths (including ~ expansion) bypass this.
         if restrict_to_root and not source_is_absolute:
-            if not self._is_within(path, root):
+            # The root may sit below a symlinked folder (see with_project_root) while norm_path
+            # resolves, so only resolve the root before declaring an escape
+            if not self._is_within(path, root) and not self._is_within(path, root.resolve()):
                 msg = f"Resolved path escapes project root: {path} (root: {root})"
                 logger.debug(msg)
                 raise ValueError(msg)
@@ -409,8 +487,8 @@ class ProjectFileLocator:
             path
         )
 
-        # Existence check
-        if must_exist and not path.exists():
+        # Existence check (lexists: no symlink follow; relative paths were already resolved by norm_path)
+        if must_exist and not os.path.lexists(path):
             raise FileNotFoundError(f"Project file not found: {path}")
 
         return path
@@ -466,6 +544,23 @@ class ProjectFileLocator:
         if not found_any:
             raise ValueError("Marker list must not be empty. Provide markers or use defaults.")
 
+    @staticmethod
+    def _normalize_root(root: Path | str) -> Path:
+        """
+        Make an explicit project root absolute, touching the filesystem as little as possible.
+
+        realpath costs a stat per path component, so it is only used where lexical
+        normalization could be wrong: '..' after a symlinked folder, or a root that is
+        itself a symlink. Otherwise abspath (CWD join + normpath, no syscalls) is enough.
+
+        Returns:
+            Absolute path to the root
+        """
+        s = os.fspath(root)
+        if ".." in Path(s).parts or os.path.islink(s):
+            return Path(os.path.realpath(s))
+        return Path(os.path.abspath(s))
+
     @staticmethod
     def _detect_start_path() -> Path:
         """
@@ -488,11 +583,63 @@ class ProjectFileLocator:
         """
         return Path.cwd().resolve()
 
+    def _ancestors(self, start: str, max_search_depth: int) -> List[str]:
+        """
+        List start and its parents, nearest first, up to max_search_depth entries.
+
+        Returns:
+            Directory strings to search; stops early at the filesystem root
+        """
+        limit = None if max_search_depth == self.UNLIMITED_DEPTH else max(max_search_depth, 0)
+        ancestors: List[str] = []
+        current = start
+        while limit is None or len(ancestors) < limit:
+            ancestors.append(current)
+            parent = os.path.dirname(current)
+            if parent == current:  # Reached filesystem root
+                break
+            current = parent
+        return ancestors
+
+    @staticmethod
+    def _entry_names(directory: str) -> frozenset[str]:
+        """
+        List the (normcased) entry names of a directory in a single scandir call.
+
+        Returns:
+            The entry names, or an empty set if the directory cannot be read
+        """
+        try:
+            with os.scandir(directory) as it:
+                return frozenset(os.path.normcase(e.name) for e in it)
+        except OSError:
+            return frozenset()
+
+    @staticmethod
+    def _has_marker(directory: str, names: frozenset[str], marker: str) -> bool:
+        """
+        Check whether a marker is present in a directory, given its entry names.
+
+        Nested markers (e.g. 'src/setup.py') are not in a directory listing, so
+        they fall back to an existence check.
+        """
+        if ProjectFileLocator._is_nested_marker(marker):
+            return os.path.exists(os.path.join(directory, marker))
+        return os.path.normcase(marker) in names
+
+    @staticmethod
+    def _is_nested_marker(marker: str) -> bool:
+        """True if the marker names a path below the directory rather than an entry in it."""
+        return os.sep in marker or bool(os.altsep and os.altsep in marker)
+
     @staticmethod
     def _is_within(path: Path, root: Path) -> bool:
         """
         Check if the path is within the root directory.
 
+        Pure string work (normcase + separator-terminated prefix); both paths are
+        expected to be absolute and already normalized.
+
         Args:
             path: Path to check
             root: Root directory to check against
@@ -500,16 +647,16 @@ class ProjectFileLocator:
         Returns:
             True if the path is under root, False otherwise
         """
-        try:
-            # Python 3.9+: Path.is_relative_to
-            return path.is_relative_to(root)  # type: ignore[attr-defined]
-        except AttributeError:
-            # Fallback for older Python
-            try:
-                path.relative_to(root)
-                return True
-            except ValueError:
-                return False
+        p = os.path.normcase(os.fspath(path))
+        r = os.path.normcase(os.fspath(root))
+        if p == r:
+            return True
+        return p.startswith(r if r.endswith(os.sep) else r + os.sep)
+
+    @staticmethod
+    def _is_volatile_path(str_path: str) -> bool:
+        """True if the path depends on the environment (env vars or ~), so its resolution can't be cached."""
+        return "$" in str_path or "%" in str_path or str_path.startswith("~")
 
     @staticmethod
     def _validate_string_path(str_path: str) -> None:
@@ -536,11 +683,9 @@ class ProjectFileLocator:
         Raises:
             ValueError: If the path is absolute or has a drive/root anchor
         """
-        err = "The path must be a *relative* path from the project root."
-        if getattr(path, "drive", "") or getattr(path, "root", ""):
-            raise ValueError(err)
-        if path.is_absolute():
-            raise ValueError(err)
+        # anchor = drive + root, so this covers absolute and drive-anchored paths (C:foo) in one check
+        if path.anchor:
+            raise ValueError("The path must be a *relative* path from the project root.")
 
     # endregion
 
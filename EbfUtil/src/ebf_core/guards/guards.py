@@ -1,3 +1,4 @@
+import os
 import traceback
 from collections.abc import Iterable
 from pathlib import Path
@@ -11,11 +12,27 @@ from typeguard import (
     check_type,
 )
 
+GUARDS_ENV = "EBF_GUARDS"
+
+_GUARDS_OFF_VALUES = frozenset({"0", "false"})
+
+
+def _guards_enabled(env_value: str | None) -> bool:
+    """Only an explicit "0" or "false" (any case) switches guards off; an unset or other value leaves them on."""
+    return env_value is None or env_value.strip().lower() not in _GUARDS_OFF_VALUES
+
+
+# Guards are on unless Python runs with -O or EBF_GUARDS switches them off.
+# When off, every ensure_* returns its candidate untouched without checking it.
+_GUARDS_ENABLED = __debug__ and _guards_enabled(os.environ.get(GUARDS_ENV))
+
 
 def ensure_not_none(candidate: Any, description: str | None = None) -> None:
     """
     Ensures that the candidate is not None, raising a ContractError if it is.
     """
+    if not _GUARDS_ENABLED:
+        return
     if candidate is None:
         prefix = f"Arg '{description}'" if description else "Value"
         _fail(
@@ -32,6 +49,9 @@ def ensure_type(candidate: Any, expected_type: type[T], description: str | None
     """
     Ensures that the candidate is of the expected type, raising a ContractError if not.
     """
+    if not _GUARDS_ENABLED or type(candidate) is expected_type:
+        # An exact match needs no help from typeguard; subclasses and generics still go through it.
+        return candidate
     try:
         check_type(
             value=candidate,
@@ -65,6 +85,8 @@ def ensure_attribute(candidate: Any, attr_spec: str, description: str | None = N
     """
     Ensures that the candidate has the specified attribute.
     """
+    if not _GUARDS_ENABLED:
+        return candidate
     ensure_not_none(candidate, description)
 
     if not hasattr(candidate, attr_spec):
@@ -89,6 +111,8 @@ def ensure_in(candidate: Any, choices: Iterable[Any], description: str | None =
     """
     Ensures that the candidate is a member of the provided choices.
     """
+    if not _GUARDS_ENABLED:
+        return
     ensure_not_none(choices, "choices")
 
     if candidate in choices:
@@ -118,30 +142,42 @@ def ensure_usable_path(candidate: Any, description: str | None = None, ) -> Path
     Ensures that the candidate is either a non-empty string or a PathLib.Path.
     Returns a Path object.
     """
-    ensure_not_none(candidate, description)
+    if not _GUARDS_ENABLED and candidate is not None:
+        # None still gets the documented error below rather than Path(None)'s TypeError.
+        return candidate if isinstance(candidate, Path) else Path(candidate)
 
-    if isinstance(candidate, Path):
-        if not str(candidate).strip():
-            prefix = f"Arg '{description}'" if description else "Value"
-            _fail(
-                message=f"{prefix} cannot be an empty path",
-                Description=description or "Unnamed",
-                Received="Empty Path",
-            )
-        return candidate
-
-    if isinstance(candidate, str):
-        ensure_str_is_valued(candidate, description)
-        return Path(candidate)
-
-    prefix = f"Arg '{description}'" if description else "Value"
+    _, result = check_usable_path(candidate, description)
+    if isinstance(result, Path):
+        return result
     _fail(
-        message=f"{prefix} must be a Path or non-empty string",
+        message=result,
         Description=description or "Unnamed",
         **{"Received Type": type(candidate).__name__},
     )
 
 
+def check_usable_path(candidate: Any, description: str | None = None, ) -> tuple[bool, Path | str]:
+    """
+    Non-raising counterpart of ensure_usable_path, for callers that only want to know.
+    Returns (True, path) for a usable candidate, else (False, the message ensure_usable_path would raise).
+    """
+    if isinstance(candidate, Path):
+        if str(candidate).strip():
+            return True, candidate
+        problem = "cannot be an empty path"
+    elif isinstance(candidate, str):
+        if candidate.strip():
+            return True, Path(candidate)
+        problem = "cannot be an empty string"
+    elif candidate is None:
+        problem = "cannot be None"
+    else:
+        problem = "must be a Path or non-empty string"
+
+    prefix = f"Arg '{description}'" if description else "Value"
+    return False, f"{prefix} {problem}"
+
+
 # region numbers
 def ensure_positive_number(
         candidate: Any,
@@ -165,6 +201,8 @@ def ensure_positive_number(
     Raises:
         ContractError: If value is not a number, negative, or zero when not allowed
     """
+    if not _GUARDS_ENABLED:
+        return candidate
     prefix = f"Arg '{description}'" if description else "Value"
 
     # 1. Type check
@@ -214,6 +252,8 @@ def ensure_false(condition: bool, description: str = "") -> None:
 
 
 def _ensure_bool_strict(condition: bool, expected: bool, description: str = "", ) -> None:
+    if not _GUARDS_ENABLED:
+        return
     if not (isinstance(condition, bool) and condition is expected):
         expected_str = "True" if expected else "False"
         message = (
@@ -237,6 +277,8 @@ def ensure_str_is_valued(candidate: Any, description: str | None = None) -> None
     """
     Ensures that the candidate is not None or an empty string, raising a ContractError if it is.
     """
+    if not _GUARDS_ENABLED:
+        return
     ensure_not_none(candidate, description)
     ensure_type(candidate, str, description)
 
@@ -251,19 +293,31 @@ def ensure_str_is_valued(candidate: Any, description: str | None = None) -> None
 
 def ensure_str_exact_length(candidate: Any, exact_length: int, description: str | None = None) -> str:
     """Ensures string has exactly exact_length characters."""
+    if not _GUARDS_ENABLED:
+        return candidate
     ensure_type(candidate, str, description)
-    return _ensure_length(candidate, exact_length=exact_length, description=description)
+    if len(candidate) != exact_length:
+        _ensure_length(candidate, exact_length=exact_length, description=description)
+    return candidate
 
 
 def ensure_str_min_length(candidate: Any, min_length: int, description: str | None = None) -> str:
+    if not _GUARDS_ENABLED:
+        return candidate
     ensure_type(candidate, str, description)
-    return _ensure_length(candidate, min_length=min_length, description=description)
+    if len(candidate) < min_length:
+        _ensure_length(candidate, min_length=min_length, description=description)
+    return candidate
 
 
 def ensure_str_max_length(candidate: Any, max_length: int, description: str | None = None) -> str:
     """Ensures string has at most min_length characters."""
+    if not _GUARDS_ENABLED:
+        return candidate
     ensure_type(candidate, str, description)
-    return _ensure_length(candidate, max_length=max_length, description=description)
+    if len(candidate) > max_length:
+        _ensure_length(candidate, max_length=max_length, description=description)
+    return candidate
 
 
 def ensure_str_length_between(
@@ -272,6 +326,8 @@ def ensure_str_length_between(
         max_length: int,
         description: str | None = None,
 ) -> str:
+    if not _GUARDS_ENABLED:
+        return candidate
     ensure_type(candidate, str, description)
     return _ensure_length(
         candidate,
@@ -1,9 +1,26 @@
+import functools
 import random
 import string
+from typing import TYPE_CHECKING
 
-import inflect
+if TYPE_CHECKING:
+    import inflect
 
-_engine = inflect.engine()
+_LETTERS = string.ascii_letters
+_LETTERS_AND_DIGITS = string.ascii_letters + string.digits
+
+
+@functools.cache
+def _engine() -> "inflect.engine":
+    """The inflect engine, built on first use; importing inflect and building it is the slow part."""
+    import inflect
+
+    return inflect.engine()
+
+
+@functools.lru_cache(maxsize=1024)
+def _plural(word: str) -> str:
+    return _engine().plural(word)
 
 
 def pluralize_word(count: int, word: str, *, show_count: bool = False) -> str:
@@ -12,20 +29,19 @@ def pluralize_word(count: int, word: str, *, show_count: bool = False) -> str:
 
     If ``show_count=True``, prefixes the number (e.g. "5 cats").
     """
-    result = word if count == 1 else _engine.plural(word)
+    result = word if count == 1 else _plural(word)
     return f"{count} {result}" if show_count else result
 
 
 def clean_string(s: str | None) -> str:
     """Return stripped string, turning None/empty into empty string."""
-    return (s or "").strip()
+    return "" if s is None else s.strip()
 
 
 def is_str_valued(s: str | None) -> bool:
     """True if ``s`` is non-None and has non-whitespace characters."""
-    if not isinstance(s, str):
-        return False
-    return bool(s and s.strip())
+    # isspace() answers "only whitespace" without building the stripped copy.
+    return isinstance(s, str) and bool(s) and not s.isspace()
 
 
 def random_string(length: int = 8, *, digits: bool = False) -> str:
@@ -34,7 +50,4 @@ def random_string(length: int = 8, *, digits: bool = False) -> str:
 
     Useful for temporary names, test data, etc.
     """
-    alphabet = string.ascii_letters
-    if digits:
-        alphabet += string.digits
-    return "".join(random.choices(alphabet, k=length))
+    return "".join(random.choices(_LETTERS_AND_DIGITS if digits else _LETTERS, k=length))
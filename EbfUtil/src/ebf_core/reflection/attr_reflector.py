@@ -1,8 +1,27 @@
+import functools
 import weakref
 from typing import Any
 
 import src.ebf_core.guards.guards as g
 
+_MISSING = object()
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_path(attr_path: str) -> tuple[tuple[str, int | None], ...]:
+    """
+    Split a dot-separated attribute path once into (segment, list index) steps; callers tend to reuse
+    the same few paths. The index is the segment parsed as an int, or None when it cannot be one.
+    """
+    steps = []
+    for segment in attr_path.split("."):
+        try:
+            index = int(segment)
+        except ValueError:
+            index = None
+        steps.append((segment, index))
+    return tuple(steps)
+
 
 class AttributeReflector:
     """
@@ -15,8 +34,17 @@ class AttributeReflector:
     Notes: functions have been written iteratively, not recursively. This is more performant and easier to debug.
     """
 
-    def __init__(self, instance: object):
+    __slots__ = ("instance", "_has_attr_cache")
+
+    def __init__(self, instance: object, *, cache_has_attr: bool = False):
+        """
+        :param instance: The object to reflect on.
+        :param cache_has_attr: Remember has_attr answers per path. Only safe when the instance is changed
+            solely through this reflector; set_value clears what has been remembered. get_value is never
+            cached and always reads the live value.
+        """
         self.instance = instance
+        self._has_attr_cache: dict[str, bool] | None = {} if cache_has_attr else None
 
     def set_value(self, attr_path: str, value: Any) -> None:
         """
@@ -28,23 +56,25 @@ class AttributeReflector:
         """
         g.ensure_str_is_valued(attr_path, "attr_path")
 
+        if self._has_attr_cache:
+            self._has_attr_cache.clear()
 
-        attrs = attr_path.split(".")
+        steps = _compile_path(attr_path)
         obj = self.instance
 
-        for i, attr in enumerate(attrs):
-            if i == len(attrs) - 1:  # Last attribute
+        for i, (attr, index) in enumerate(steps):
+            if i == len(steps) - 1:  # Last attribute
                 if isinstance(obj, dict):
                     obj[attr] = value
                 elif isinstance(obj, list):
-                    self._set_list_value(obj, attr, value)
+                    self._set_list_value(obj, attr, index, value)
                 elif hasattr(obj, attr):
                     setattr(obj, attr, value)
                 else:
                     raise AttributeError(f"'{type(obj).__name__}' object has no attribute '{attr}'")
                 break
 
-            obj = self._traverse_to_next_obj(obj, attr)
+            obj = self._traverse_to_next_obj(obj, attr, index)
 
     def get_value(self, attr_path: str) -> Any:
         """
@@ -56,12 +86,12 @@ class AttributeReflector:
         """
         g.ensure_str_is_valued(attr_path, "attr_path")
 
-        attrs = attr_path.split(".")
+        steps = _compile_path(attr_path)
         obj = self.instance
 
-        for i, attr in enumerate(attrs):
+        for i, (attr, index) in enumerate(steps):
             try:
-                obj = self._traverse_to_next_obj(obj, attr, create_missing=False)
+                obj = self._traverse_to_next_obj(obj, attr, index, create_missing=False)
 
                 # Resolve weak references only if obj is not None
                 if obj is not None:
@@ -70,7 +100,7 @@ class AttributeReflector:
                 raise AttributeError(f"'{type(self.instance).__name__}' object has no attribute '{attr_path}'")
 
             # If the attribute is None but exists, break and return None
-            if obj is None and i < len(attrs) - 1:
+            if obj is None and i < len(steps) - 1:
                 raise AttributeError(f"'{type(self.instance).__name__}' object has no attribute '{attr_path}'")
 
         return obj
@@ -84,71 +114,97 @@ class AttributeReflector:
         """
         g.ensure_str_is_valued(attr_path, "attr_path")
 
-        attrs = attr_path.split(".")
+        cache = self._has_attr_cache
+        if cache is not None and attr_path in cache:
+            return cache[attr_path]
+
+        found = self._has_path(attr_path)
+        if cache is not None:
+            cache[attr_path] = found
+        return found
+
+    # region helpers
+
+    def _has_path(self, attr_path: str) -> bool:
+        """
+        Walks attr_path from the instance; the uncached body of has_attr.
+
+        A miss is answered with a sentinel or a bounds check rather than by raising and catching,
+        since has_attr is often asked about paths that are not there.
+        """
         obj = self.instance
 
-        for attr in attrs:
-            try:
-                obj = self._traverse_to_next_obj(obj, attr, create_missing=False)
+        for attr, index in _compile_path(attr_path):
+            if isinstance(obj, dict):
+                obj = obj.get(attr, _MISSING)
+            elif isinstance(obj, list):
+                if index is None:
+                    return False
+                obj = obj[index] if -len(obj) <= index < len(obj) else _MISSING
+            else:
+                obj = getattr(obj, attr, _MISSING)
 
-                # Only resolve weak references if obj is not None
-                if obj is not None:
-                    obj = self._resolve_weak_method(obj)
-            except (AttributeError, KeyError, IndexError):
+            if obj is _MISSING:
                 return False
 
+            if isinstance(obj, weakref.WeakMethod):
+                try:
+                    obj = self._resolve_weak_method(obj)
+                except AttributeError:
+                    return False
+
             # If obj is None after traversing, return True (attribute exists but is None)
             if obj is None:
                 return True
 
         return True
 
-    # region helpers
-
     @staticmethod
-    def _set_list_value(obj, attr, value) -> None:
+    def _set_list_value(obj, attr, index, value) -> None:
         """
         Set a value in a list at the specified index.
 
         :param obj: The list object.
         :param attr: The index as a string.
+        :param index: The index as compiled by _compile_path (None if attr is not an int).
         :param value: The value to set at the specified index.
         :raises IndexError: If the index is invalid.
         """
+        if index is None:
+            raise IndexError(f"Invalid index '{attr}' for list")
         try:
-            index = int(attr)
             obj[index] = value
-        except (ValueError, IndexError):
+        except IndexError:
             raise IndexError(f"Invalid index '{attr}' for list")
 
     @staticmethod
-    def _get_list_element(obj, attr, create_missing: bool = True):
+    def _get_list_element(obj, attr, index, create_missing: bool = True):
         """
         Get a list element by index. Optionally, create missing elements.
 
         :param obj: The list object.
         :param attr: The index as a string.
+        :param index: The index as compiled by _compile_path (None if attr is not an int).
         :param create_missing: Whether to create missing elements.
         :return: The value at the specified index.
         :raises IndexError: If the index is invalid.
         """
-        try:
-            index = int(attr)
-            if index >= len(obj):
-                if create_missing:
-                    obj.extend([None] * (index - len(obj) + 1))
-                else:
-                    raise IndexError(f"Index '{index}' out of bounds for list")
-            return obj[index]
-        except ValueError:
+        if index is None:
             raise IndexError(f"Invalid index '{attr}' for list")
+        if index >= len(obj):
+            if create_missing:
+                obj.extend([None] * (index - len(obj) + 1))
+            else:
+                raise IndexError(f"Index '{index}' out of bounds for list")
+        return obj[index]
 
-    def _traverse_to_next_obj(self, obj, attr, create_missing: bool = True):
+    def _traverse_to_next_obj(self, obj, attr, index=None, create_missing: bool = True):
         """
         Traverse to the next object in the attribute path. Optionally, create missing entries.
 
         :param obj: The current object in the traversal.
         :param attr: The attribute or key to traverse.
+        :param index: attr as a list index, as compiled by _compile_path (None if attr is not an int).
         :param create_missing: If True, create missing dictionaries or list entries. If False, check existence only.
         :return: The next object in the attribute path.
         :raises AttributeError: If the attribute does not exist.
@@ -163,15 +219,16 @@ class AttributeReflector:
                     raise KeyError(f"Key '{attr}' not found in dictionary")
             return obj[attr]
         elif isinstance(obj, list):
-            return self._get_list_element(obj, attr, create_missing)
-        elif hasattr(obj, attr):
-            next_obj = getattr(obj, attr)
+            return self._get_list_element(obj, attr, index, create_missing)
+        else:
+            # One lookup, not hasattr() followed by getattr()
+            next_obj = getattr(obj, attr, _MISSING)
+            if next_obj is _MISSING:
+                raise AttributeError(f"'{type(obj).__name__}' object has no attribute '{attr}'")
             if next_obj is None and create_missing:
                 setattr(obj, attr, {})
                 return getattr(obj, attr)
             return next_obj
-        else:
-            raise AttributeError(f"'{type(obj).__name__}' object has no attribute '{attr}'")
 
     @staticmethod
     def _resolve_weak_method(obj):
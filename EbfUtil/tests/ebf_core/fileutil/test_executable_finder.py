@@ -1,6 +1,5 @@
 import os
 from pathlib import Path
-from unittest.mock import patch
 import pytest
 
 # noinspection SpellCheckingInspection
@@ -15,6 +14,28 @@ from ebf_core.fileutil.executable_finder import (
 )
 
 
+_EXE_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0)
+
+
+def _write_fake_exe(path: str, mode: int = 0o755) -> None:
+    """Create an executable stub; the mode is applied by open() itself, so no separate chmod."""
+    fd = os.open(path, _EXE_OPEN_FLAGS, mode)
+    try:
+        os.write(fd, b"echo")
+    finally:
+        os.close(fd)
+
+
+def _make_shortcuts(base: Path, vendor: str, *names: str) -> list[Path]:
+    """Build the Start Menu Programs/<vendor> tree under base in one call and drop empty shortcuts into it."""
+    vendor_dir = start_menu_path(base, vendor)
+    os.makedirs(vendor_dir)
+    shortcuts = [vendor_dir / n for n in names]
+    for s in shortcuts:
+        s.write_bytes(b"")
+    return shortcuts
+
+
 @pytest.fixture(params=[[], None])
 def targets(request):
     return request.param
@@ -24,22 +45,19 @@ def targets(request):
 def system_path_with_fake_exes(tmp_path, monkeypatch):
 
     def _make_exes(*names: str) -> list[str]:
-        bin_dir = tmp_path / "bin"
-        bin_dir.mkdir()
-        made = []
+        bin_dir = os.path.join(tmp_path, "bin")
+        os.makedirs(bin_dir, exist_ok=True)
+        stubs: list[tuple[str, int]] = []
         for n in names:
-            p = bin_dir / n
-            p.write_text("echo")
-            p.chmod(0o755)
-            made.append(str(p))
+            stubs.append((os.path.join(bin_dir, n), 0o755))
             # Windows: if the caller passes "foo" (no ext), the resolver will look for foo.exe/.bat/.cmd.
             # Create foo.exe so the search via PATHEXT succeeds.
-            if os.name == "nt":
-                root, ext = os.path.splitext(n)
-                if not ext:  # only when the requested name had no extension
-                    (bin_dir / f"{n}.exe").write_text("echo")
+            if os.name == "nt" and not os.path.splitext(n)[1]:
+                stubs.append((os.path.join(bin_dir, f"{n}.exe"), 0o755))
+        for path, mode in stubs:
+            _write_fake_exe(path, mode)
         # Ensure our bin is searched and PATHEXT expansion works
-        monkeypatch.setenv("PATH", str(bin_dir))
+        monkeypatch.setenv("PATH", bin_dir)
         if os.name == "nt":
             monkeypatch.setenv("PATHEXT", ".EXE;.BAT;.CMD")
         return list(names)
@@ -109,118 +127,89 @@ class TestFindOnSystemPath:
 
 
 class TestFindStartMenuShortcut:
-    def test_prefers_user_shortcut_over_machine(self, tmp_path: Path):
+    def test_prefers_user_shortcut_over_machine(self, tmp_path: Path, monkeypatch):
         appdata = tmp_path / "appdata"
         machine = tmp_path / "machine"
-        user_shortcut = start_menu_path(appdata, "Fidelity Investments" , "Fidelity.lnk")
-        machine_shortcut = start_menu_path(machine, "Fidelity Investments" , "Fidelity.lnk")
-        user_shortcut.parent.mkdir(parents=True)
-        machine_shortcut.parent.mkdir(parents=True)
-        user_shortcut.write_text("")
-        machine_shortcut.write_text("")
-
-        with patch.dict(os.environ, {"APPDATA": str(appdata), "PROGRAMDATA": str(machine)}, clear=False):
-            p = find_start_menu_shortcut(
-                vendor_folders=["Fidelity Investments"],
-                patterns=["*fidelity*.lnk", "*active*trader*pro*.lnk"],
-            )
+        [user_shortcut] = _make_shortcuts(appdata, "Fidelity Investments", "Fidelity.lnk")
+        _make_shortcuts(machine, "Fidelity Investments", "Fidelity.lnk")
+
+        monkeypatch.setenv("APPDATA", str(appdata))
+        monkeypatch.setenv("PROGRAMDATA", str(machine))
+        p = find_start_menu_shortcut(
+            vendor_folders=["Fidelity Investments"],
+            patterns=["*fidelity*.lnk", "*active*trader*pro*.lnk"],
+        )
         assert p == user_shortcut
 
-    def test_pattern_specificity_wins(self, tmp_path: Path):
+    def test_pattern_specificity_wins(self, tmp_path: Path, monkeypatch):
         appdata = tmp_path / "appdata"
-        shortcut1 = start_menu_path(appdata, "Fidelity Investments" , "Fidelity.lnk")
-        shortcut2 = start_menu_path(appdata, "Fidelity Investments" , "Active Trader Pro.lnk")
-        shortcut1.parent.mkdir(parents=True)
-        shortcut1.write_text("")
-        shortcut2.write_text("")
-
-        with patch.dict(os.environ, {"APPDATA": str(appdata)}, clear=False):
-            p = find_start_menu_shortcut(
-                vendor_folders=["Fidelity Investments"],
-                patterns=["*active*trader*pro*.lnk", "*fidelity*.lnk"],
-            )
+        _, shortcut2 = _make_shortcuts(appdata, "Fidelity Investments", "Fidelity.lnk", "Active Trader Pro.lnk")
+
+        monkeypatch.setenv("APPDATA", str(appdata))
+        p = find_start_menu_shortcut(
+            vendor_folders=["Fidelity Investments"],
+            patterns=["*active*trader*pro*.lnk", "*fidelity*.lnk"],
+        )
         assert p == shortcut2, "there are more literals in shortcut2, making it more specific"
 
-    def test_none_when_no_candidates(self, tmp_path: Path):
-        with patch.dict(
-            os.environ,
-            {
-                "APPDATA": str(tmp_path / "appdata"),
-                "PROGRAMDATA": str(tmp_path / "programdata"),
-            },
-            clear=False,
-        ):
-            assert (
-                find_start_menu_shortcut(
-                    vendor_folders=["Fidelity Investments"],
-                    patterns=["*active*trader*pro*.lnk", "*fidelity*.lnk"],
-                )
-                is None
+    def test_none_when_no_candidates(self, tmp_path: Path, monkeypatch):
+        monkeypatch.setenv("APPDATA", str(tmp_path / "appdata"))
+        monkeypatch.setenv("PROGRAMDATA", str(tmp_path / "programdata"))
+        assert (
+            find_start_menu_shortcut(
+                vendor_folders=["Fidelity Investments"],
+                patterns=["*active*trader*pro*.lnk", "*fidelity*.lnk"],
             )
+            is None
+        )
 
 
 class TestFindInCommonRoots:
 
-    def test_glob_search_finds_first_match(self, tmp_path: Path):
+    @pytest.fixture
+    def set_roots(self, tmp_path, monkeypatch):
+        """Point the common install roots at tmp_path; only the touched keys are restored afterwards."""
+
+        def _set(program_files: Path) -> None:
+            monkeypatch.setenv(PGM_FILES_STR, str(program_files))
+            monkeypatch.setenv(f"{PGM_FILES_STR}(X86)", str(tmp_path / "Program Files (x86)"))
+            monkeypatch.setenv("LOCALAPPDATA", str(tmp_path / "LocalAppData"))
+            monkeypatch.setenv("ProgramData", str(tmp_path / "ProgramData"))
+        return _set
+
+    def test_glob_search_finds_first_match(self, tmp_path: Path, set_roots):
         program_files = tmp_path / "Program Files"
-        program_files_x86 = tmp_path / "Program Files (x86)"
         exe_path = program_files / "Fidelity Investments" / "Active Trader Pro" / "ATP.exe"
         exe_path.parent.mkdir(parents=True)
         exe_path.write_text("")
 
-        with patch.dict(
-            os.environ,
-            {
-                PGM_FILES_STR: str(program_files),
-                f"{PGM_FILES_STR}(X86)": str(program_files_x86),
-            },
-            clear=False,
-        ):
-            p = find_in_common_roots(["**/Fidelity*/Active*Trader*Pro*/**/*"])
+        set_roots(program_files)
+        p = find_in_common_roots(["**/Fidelity*/Active*Trader*Pro*/**/*"])
         assert p == exe_path.resolve()
 
-    def test_returns_none_when_no_match(self, tmp_path: Path):
-        with patch.dict(
-                os.environ,
-                {
-                    PGM_FILES_STR: str(tmp_path / "Program Files"),
-                    f"{PGM_FILES_STR}(X86)": str(tmp_path / "Program Files (x86)"),
-                    "LOCALAPPDATA": str(tmp_path / "LocalAppData"),
-                    "ProgramData": str(tmp_path / "ProgramData"),
-                },
-                clear=False,
-        ):
-            assert find_in_common_roots(["**/*.exe"]) is None
-
-    def test_non_recursive_glob_does_not_descend(self, tmp_path, monkeypatch):
+    def test_returns_none_when_no_match(self, tmp_path: Path, set_roots):
+        set_roots(tmp_path / "Program Files")
+        assert find_in_common_roots(["**/*.exe"]) is None
+
+    def test_non_recursive_glob_does_not_descend(self, tmp_path, set_roots):
         root = tmp_path / "Program Files"
         nested = root / "Vendor" / "App"
         nested.mkdir(parents=True)
         (nested / "tool.exe").write_text("x")
 
-        with patch.dict(os.environ, {
-            PGM_FILES_STR: str(root),
-            f"{PGM_FILES_STR}(X86)": str(tmp_path / "Program Files (x86)"),
-            "LOCALAPPDATA": str(tmp_path / "LocalAppData"),
-            "ProgramData": str(tmp_path / "ProgramData"),
-        }, clear=False):
-            assert find_in_common_roots(["*.exe"]) is None
+        set_roots(root)
+        assert find_in_common_roots(["*.exe"]) is None
 
-    def test_recursive_glob_descends(self, tmp_path, monkeypatch):
+    def test_recursive_glob_descends(self, tmp_path, set_roots):
         root = tmp_path / "Program Files"
         nested = root / "Vendor" / "App"
         exe = nested / "tool.exe"
         nested.mkdir(parents=True)
         exe.write_text("x")
 
-        with patch.dict(os.environ, {
-            PGM_FILES_STR: str(root),
-            f"{PGM_FILES_STR}(X86)": str(tmp_path / "Program Files (x86)"),
-            "LOCALAPPDATA": str(tmp_path / "LocalAppData"),
-            "ProgramData": str(tmp_path / "ProgramData"),
-        }, clear=False):
-            found = find_in_common_roots(["**/*.exe"])
-            assert found == exe.resolve()
+        set_roots(root)
+        found = find_in_common_roots(["**/*.exe"])
+        assert found == exe.resolve()
 
 
 class TestBestOf:
@@ -5,6 +5,20 @@ import pytest
 from ebf_core.fileutil.path_norm import norm_path
 
 
+@pytest.fixture(scope="session")
+def fake_home(tmp_path_factory) -> Path:
+    """One home directory for the whole session; the tests only read paths under it."""
+    return tmp_path_factory.mktemp("home")
+
+
+@pytest.fixture
+def home_env(fake_home, monkeypatch) -> Path:
+    """Point the system home (HOME, and USERPROFILE on Windows) at fake_home for one test."""
+    monkeypatch.setenv("HOME", str(fake_home))
+    monkeypatch.setenv("USERPROFILE", str(fake_home))
+    return fake_home
+
+
 class TestNormPath:
     class TestValueArg:
 
@@ -70,87 +84,61 @@ class TestNormPath:
             p = norm_path("$TEST_DIR/file.txt", expand_env=False)
             assert "$TEST_DIR" in str(p)
 
-        def test_tilde_expands_to_home(self, tmp_path, monkeypatch):
-            home = tmp_path / "home"
-            home.mkdir()
-            monkeypatch.setenv("HOME", str(home))
-            monkeypatch.setenv("USERPROFILE", str(home))
+        def test_tilde_expands_to_home(self, home_env):
             p = norm_path("~/x.txt")
-            assert p == home / "x.txt"
+            assert p == home_env / "x.txt"
             assert p.is_absolute()
 
-        def test_tilde_disabled(self, tmp_path, monkeypatch):
-            home = tmp_path / "home"
-            home.mkdir()
-            monkeypatch.setenv("HOME", str(home))
-            monkeypatch.setenv("USERPROFILE", str(home))
+        def test_tilde_disabled(self, home_env):
             p = norm_path("~/x.txt", expand_user=False)
             assert p.as_posix() == "~/x.txt"
             assert not p.is_absolute()
 
-        def test_env_var_with_tilde(self, tmp_path, monkeypatch):
+        def test_env_var_with_tilde(self, home_env, monkeypatch):
             """Env vars should expand before tilde expansion."""
-            home = tmp_path / "home"
-            home.mkdir()
-            monkeypatch.setenv("HOME", str(home))
-            monkeypatch.setenv("USERPROFILE", str(home))
             monkeypatch.setenv("SUBDIR", "docs")
 
             p = norm_path("~/$SUBDIR/file.txt")
-            assert p == home / "docs" / "file.txt"
+            assert p == home_env / "docs" / "file.txt"
 
-        def test_tilde_expands_to_custom_home(self, tmp_path):
+        def test_tilde_expands_to_custom_home(self, fake_home):
             """Tilde should expand to the custom home when provided."""
-            custom_home = tmp_path / "custom-home"
-            custom_home.mkdir()
+            p = norm_path("~/config.yml", home=fake_home)
 
-            p = norm_path("~/config.yml", home=custom_home)
-
-            assert p == custom_home / "config.yml"
+            assert p == fake_home / "config.yml"
             assert p.is_absolute()
 
-        def test_tilde_with_subdir_expands_to_custom_home(self, tmp_path):
+        def test_tilde_with_subdir_expands_to_custom_home(self, fake_home):
             """Tilde with a nested path should expand to the custom home."""
-            custom_home = tmp_path / "custom-home"
-            custom_home.mkdir()
-
-            p = norm_path("~/.config/app/settings.yml", home=custom_home)
+            p = norm_path("~/.config/app/settings.yml", home=fake_home)
 
-            assert p == custom_home / ".config" / "app" / "settings.yml"
-            assert p.parent.parent == custom_home / ".config"
+            assert p == fake_home / ".config" / "app" / "settings.yml"
+            assert p.parent.parent == fake_home / ".config"
 
-        def test_custom_home_ignored_when_expand_user_false(self, tmp_path):
+        def test_custom_home_ignored_when_expand_user_false(self, fake_home):
             """Custom home should be ignored if expand_user=False."""
-            custom_home = tmp_path / "custom-home"
-            custom_home.mkdir()
-
-            p = norm_path("~/config.yml", home=custom_home, expand_user=False)
+            p = norm_path("~/config.yml", home=fake_home, expand_user=False)
 
             assert p == Path("~/config.yml")
             assert not p.is_absolute()
 
-        def test_tilde_user_falls_back_to_standard_expansion(self, tmp_path):
+        def test_tilde_user_falls_back_to_standard_expansion(self, fake_home):
             """~username should fall back to system expansion (can't override other users)."""
-            custom_home = tmp_path / "custom-home"
-            custom_home.mkdir()
-
             # ~other-user should use standard Path.expanduser(), not custom home
-            p = norm_path("~root/file.txt", home=custom_home)
+            p = norm_path("~root/file.txt", home=fake_home)
 
             # This will expand to the real root user's home (or fail)
             # We can't easily control ~other-user expansion
-            assert p != custom_home / "root" / "file.txt"
+            assert p != fake_home / "root" / "file.txt"
 
-        def test_custom_home_with_base_resolution(self, tmp_path):
+        def test_custom_home_with_base_resolution(self, fake_home, tmp_path):
             """Custom home expansion should work before base resolution."""
-            custom_home = tmp_path / "custom-home"
-            custom_home.mkdir()
             base = tmp_path / "project"
             base.mkdir()
 
             # ~ expands first, then if still relative, the base applies.
             # But ~ always makes it absolute, so base won't apply
-            p = norm_path("~/config.yml", home=custom_home, base=base)
+            p = norm_path("~/config.yml", home=fake_home, base=base)
 
-            assert p == custom_home / "config.yml"
+            assert p == fake_home / "config.yml"
             # base is ignored because ~ made it absolute
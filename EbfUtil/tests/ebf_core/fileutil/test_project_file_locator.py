@@ -1,16 +1,86 @@
+import copy
 import logging
 import os
+import pickle
 import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import nullcontext as does_not_raise
 from pathlib import Path
 
 import pytest
 
-from ebf_core.fileutil.project_file_locator import ProjectFileLocator, logger
+from ebf_core.fileutil import project_file_locator as locator_module
+from ebf_core.fileutil.project_file_locator import PARALLEL_ROOT_SEARCH_ENV, ProjectFileLocator, logger
+
+# Default-configured locator to build from; builders return new instances (with empty caches),
+# so only call builders on it, never the cache-filling queries
+PROTO = ProjectFileLocator()
+
+DEFAULT_RELPATH = Path(ProjectFileLocator.DEFAULT_PROJECT_FILE_RELATIVE_PATH)
+PYPROJECT = Path("pyproject.toml")
+OUTSIDE_RELPATH = Path("..") / Path(__file__).name
+# Expected error messages, compiled once (pytest.raises accepts a compiled pattern for match=)
+EMPTY_RELPATH_MSG = re.compile(re.escape("Arg 'relpath' cannot be an empty string"))
+DOT_RELPATH_MSG = re.compile(re.escape("'.' is not allowed as a project file"))
+TILDE_RELPATH_MSG = re.compile(re.escape("~ expansion is not allowed in with_sticky_project_file"))
+NOT_RELATIVE_MSG = re.compile(re.escape("must be a *relative* path from the project root"))
+ESCAPES_ROOT_MSG = re.compile("Resolved path escapes project root")
+EMPTY_MARKERS_MSG = re.compile("Marker list must not be empty")
+
+# An absolute path that is never created, for tests of pure path logic (drive-qualified on Windows)
+ABS_PATH = Path(os.path.abspath(os.path.join(os.sep, "ebf-no-such-dir", "proj")))
+
+
+_SEED_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0)
+
+
+def _seed_files(root: Path, *relpaths: str) -> None:
+    """Create empty files under root: each parent folder once, then one open/close per file."""
+    paths = [os.path.join(root, rp) for rp in relpaths]
+    for folder in {os.path.dirname(p) for p in paths}:
+        os.makedirs(folder, exist_ok=True)
+    for p in paths:
+        os.close(os.open(p, _SEED_OPEN_FLAGS, 0o644))
+
+
+class _LogSpy(logging.Handler):
+    """Collects the locator's log messages only; lighter than caplog, which captures every logger."""
+
+    def __init__(self):
+        super().__init__(logging.DEBUG)
+        self.messages: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
+
+    def clear(self) -> None:
+        self.messages.clear()
+
+    def __contains__(self, text: str) -> bool:
+        return any(text in m for m in self.messages)
 
 
 @pytest.fixture
+def log_events():
+    spy = _LogSpy()
+    old_level = logger.level
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(spy)
+    yield spy
+    logger.removeHandler(spy)
+    logger.setLevel(old_level)
+
+
+@pytest.fixture(scope="class")
 def sut() -> ProjectFileLocator:
+    """These tests only read defaults or call builders, which return new instances."""
+    return PROTO
+
+
+@pytest.fixture
+def fresh_sut() -> ProjectFileLocator:
+    """A new locator per test, for tests that run (and so cache) a marker search."""
     return ProjectFileLocator()
 
 
@@ -18,10 +88,10 @@ def sut() -> ProjectFileLocator:
 class TestWithProjectRoot:
 
     def test_project_root_default_is_none(self, sut):
-        assert sut._project_root is None
+        assert sut.project_root is None
 
-    def test_new_instance_is_created(self, sut, tmp_path):
-        sut_clone = sut.with_project_root(tmp_path)
+    def test_new_instance_is_created(self, sut):
+        sut_clone = sut.with_project_root(ABS_PATH)
         assert sut_clone is not sut
 
     def test_when_arg_is_path(self, sut, tmp_path):
@@ -31,6 +101,22 @@ class TestWithProjectRoot:
         actual = sut.with_project_root(tmp_path).project_root
         assert actual == expected
 
+    def test_when_arg_is_symlink_it_is_resolved(self, sut, tmp_path):
+        target = tmp_path / "real"
+        target.mkdir()
+        link = tmp_path / "link"
+        try:
+            link.symlink_to(target, target_is_directory=True)
+        except OSError:
+            pytest.skip("symlinks are not available")
+
+        assert sut.with_project_root(link).project_root == target.resolve()
+
+    def test_relative_arg_is_made_absolute_against_cwd(self, sut, tmp_path, monkeypatch):
+        (tmp_path / "proj").mkdir()
+        monkeypatch.chdir(tmp_path)
+        assert sut.with_project_root(Path("proj")).project_root == tmp_path.resolve() / "proj"
+
     def test_arg_of_none_resets_the_root_to_none(self, sut, tmp_path):
         sut_with_path = sut.with_project_root(tmp_path)
         assert sut_with_path.project_root == tmp_path.resolve()
@@ -61,7 +147,7 @@ class TestWithMarkers:
     def test_priority_marker_default_is_none(self, sut):
         assert sut._priority_marker is None
 
-    def test_with_markers_creates_new_instance(self, sut, tmp_path):
+    def test_with_markers_creates_new_instance(self, sut):
         sut_clone = sut.with_markers(['blah'])
         assert sut_clone is not sut
 
@@ -72,42 +158,130 @@ class TestWithMarkers:
         assert s2._markers == m and s2._priority_marker == ".git"
 
 
+@pytest.fixture(scope="session")
+def fake_repo(tmp_path_factory) -> Path:
+    root = tmp_path_factory.mktemp("repo").resolve()
+    (root / ".git").mkdir()
+    return root
+
+
+@pytest.fixture
+def start_in_fake_repo(fake_repo, monkeypatch) -> Path:
+    """Start marker searches in fake_repo, so log assertions don't depend on where pytest runs."""
+    monkeypatch.setattr(ProjectFileLocator, "_detect_start_path", staticmethod(lambda: fake_repo))
+    return fake_repo
+
+
 @pytest.mark.integration
 class TestGetProjectRoot:
 
-    def test_user_provided_project_root_is_returned_first_when_available(self, rooted_sut, caplog):
-        caplog.set_level(logging.DEBUG, logger=logger.name)
+    def test_user_provided_project_root_is_returned_first_when_available(self, rooted_sut, log_events):
         rooted_sut.get_project_root()
 
-        assert "user provided" in caplog.text
+        assert "user provided" in log_events
+
+        assert "marker search" not in log_events
+
+    def test_markers_are_used_when_no_project_root_is_available(self, fresh_sut, log_events, start_in_fake_repo):
+        fresh_sut.get_project_root()
+
+        assert "user provided" not in log_events
+
+        assert "marker search" in log_events
+
+    def test_default_markers_can_determine_the_project_root(self, fresh_sut, log_events, start_in_fake_repo):
+        found = fresh_sut.get_project_root()
+        assert found == start_in_fake_repo
+
+        assert "Found marker '.git'" in log_events
+
+    def test_the_start_path_is_returned_if_the_marker_search_fails(self, fresh_sut, log_events, start_in_fake_repo):
+        found = fresh_sut.with_markers(["blah"]).get_project_root()
+        assert found.exists() and found == fresh_sut._detect_start_path()
+
+        assert "Found marker" not in log_events
+
+    def test_nested_marker_is_found(self, fresh_sut, tmp_path, monkeypatch):
+        proj = tmp_path / "proj"
+        _seed_files(proj, "src/setup.py")
+        os.makedirs(proj / "pkg")
+        monkeypatch.chdir(proj / "pkg")
+
+        assert fresh_sut.with_markers(["src/setup.py"]).get_project_root() == proj.resolve()
+
+    def test_cached_root_is_used_on_second_call(self, fresh_sut, log_events):
+        first = fresh_sut.get_project_root()
+        log_events.clear()
+
+        assert fresh_sut.get_project_root() == first
+        assert "cached project root" in log_events
+        assert "marker search" not in log_events
+
+    def test_cache_can_be_bypassed(self, fresh_sut, log_events):
+        fresh_sut.get_project_root()
+        log_events.clear()
+
+        fresh_sut.get_project_root(use_cache=False)
+        assert "marker search" in log_events
+
+    def test_cache_is_keyed_on_cwd(self, fresh_sut, tmp_path, monkeypatch):
+        for name in ("a", "b"):
+            (tmp_path / name / ".git").mkdir(parents=True)
+        monkeypatch.chdir(tmp_path / "a")
+        assert fresh_sut.get_project_root() == (tmp_path / "a").resolve()
+
+        monkeypatch.chdir(tmp_path / "b")
+        assert fresh_sut.get_project_root() == (tmp_path / "b").resolve()
+
+    def test_builders_do_not_share_the_cache(self, fresh_sut, tmp_path, monkeypatch):
+        _seed_files(tmp_path / "proj", "setup.cfg")
+        os.makedirs(tmp_path / "proj" / "pkg")
+        monkeypatch.chdir(tmp_path / "proj" / "pkg")
+        assert fresh_sut.with_markers(["blah"]).get_project_root() == (tmp_path / "proj" / "pkg").resolve()
+
+        assert fresh_sut.with_markers(["setup.cfg"]).get_project_root() == (tmp_path / "proj").resolve()
 
-        assert "marker search" not in caplog.text
+    def test_patched_default_markers_reach_a_prebuilt_locator(self, fresh_sut, tmp_path, monkeypatch):
+        _seed_files(tmp_path / "proj", "tools/ebf.marker")
+        os.makedirs(tmp_path / "proj" / "pkg")
+        monkeypatch.chdir(tmp_path / "proj" / "pkg")
+        monkeypatch.setattr(ProjectFileLocator, "DEFAULT_MARKERS", ["tools/ebf.marker"])
 
-    def test_markers_are_used_when_no_project_root_is_available(self, sut, caplog):
-        caplog.set_level(logging.DEBUG, logger=logger.name)
-        sut.get_project_root()
+        assert fresh_sut.get_project_root() == (tmp_path / "proj").resolve()
 
-        assert "user provided" not in caplog.text
+    @pytest.mark.parametrize("env_value, uses_pool", [("1", True), (None, False)], ids=["parallel", "sequential"])
+    def test_parallel_search_finds_the_nearest_marker(self, fresh_sut, tmp_path, monkeypatch, env_value, uses_pool):
+        (tmp_path / ".git").mkdir()
+        (tmp_path / "proj" / ".git").mkdir(parents=True)
+        deep = tmp_path / "proj" / "a" / "b" / "c"
+        deep.mkdir(parents=True)
+        monkeypatch.chdir(deep)
+        if env_value is None:
+            monkeypatch.delenv(PARALLEL_ROOT_SEARCH_ENV, raising=False)
+        else:
+            monkeypatch.setenv(PARALLEL_ROOT_SEARCH_ENV, env_value)
 
-        assert "marker search" in caplog.text
+        pool_calls = []
+        real_scan_pool = locator_module._scan_pool
 
-    def test_default_markers_can_determine_the_project_root(self, sut, caplog):
-        caplog.set_level(logging.DEBUG, logger=logger.name)
-        found = sut.get_project_root()
-        assert found.exists()
+        def spy_scan_pool():
+            pool_calls.append(True)
+            return real_scan_pool()
 
-        assert "Found marker '.git'" in caplog.text
+        monkeypatch.setattr(locator_module, "_scan_pool", spy_scan_pool)
 
-    def test_the_start_path_is_returned_if_the_marker_search_fails(self, sut, caplog):
-        caplog.set_level(logging.DEBUG, logger=logger.name)
-        found = sut.with_markers(["blah"]).get_project_root()
-        assert found.exists() and found == sut._detect_start_path()
+        assert fresh_sut.get_project_root() == (tmp_path / "proj").resolve()
+        assert bool(pool_calls) is uses_pool
 
-        assert "Found marker" not in caplog.text
+    def test_zero_depth_falls_back_to_the_start_path(self, fresh_sut, tmp_path, monkeypatch):
+        (tmp_path / ".git").mkdir()
+        monkeypatch.chdir(tmp_path)
 
-    def test_markers_are_validated(self, sut):
-        with pytest.raises(ValueError, match="Marker list must not be empty"):
-            sut.with_markers([]).get_project_root()
+        assert fresh_sut.get_project_root(max_search_depth=0) == fresh_sut._detect_start_path()
+
+    def test_markers_are_validated(self, fresh_sut):
+        with pytest.raises(ValueError, match=EMPTY_MARKERS_MSG):
+            fresh_sut.with_markers([]).get_project_root()
 
 
 @pytest.mark.integration
@@ -122,55 +296,55 @@ class TestWithStickyProjectFile:
 
     def test_default_arg_is_known_default_path(self, sut):
         result = sut.with_sticky_project_file()
-        assert result.project_file_relpath == Path(result.DEFAULT_PROJECT_FILE_RELATIVE_PATH)
+        assert result.project_file_relpath == DEFAULT_RELPATH
 
     def test_arg_sets_the_relpath(self, sut):
         result = sut.with_sticky_project_file("pyproject.toml")
-        assert result.project_file_relpath == Path("pyproject.toml")
+        assert result.project_file_relpath == PYPROJECT
 
     def test_empty_str_is_error(self, sut):
-        msg = re.escape("Arg 'relpath' cannot be an empty string")
-
-        with pytest.raises(AssertionError, match=msg):
+        with pytest.raises(AssertionError, match=EMPTY_RELPATH_MSG):
             sut.with_sticky_project_file("")
 
     def test_single_dot_is_not_allowed(self, sut):
-        msg = re.escape("'.' is not allowed as a project file")
-
-        with pytest.raises(ValueError, match=msg):
+        with pytest.raises(ValueError, match=DOT_RELPATH_MSG):
             sut.with_sticky_project_file(".")
 
     def test_tilde_expanded_is_not_allowed(self, rooted_sut):
-        msg = "~ expansion is not allowed in with_sticky_project_file."
-
-        with pytest.raises(ValueError, match=msg):
+        with pytest.raises(ValueError, match=TILDE_RELPATH_MSG):
             rooted_sut.with_sticky_project_file("~/settings.yaml")
 
     def test_none_arg_clears_the_relpath(self, sut):
         result = sut.with_sticky_project_file()
-        assert result.project_file_relpath == Path(result.DEFAULT_PROJECT_FILE_RELATIVE_PATH)
+        assert result.project_file_relpath == DEFAULT_RELPATH
 
         result = result.with_sticky_project_file(None)
         assert result.project_file_relpath is None
 
-    def test_absolute_project_file_path_is_not_allowed(self, sut, tmp_path):
-        assert tmp_path.is_absolute()
+    def test_absolute_project_file_path_is_not_allowed(self, sut):
+        assert ABS_PATH.is_absolute()
 
-        msg = re.escape("must be a *relative* path from the project root")
-        with pytest.raises(ValueError, match=msg):
-            sut.with_sticky_project_file(tmp_path)
+        with pytest.raises(ValueError, match=NOT_RELATIVE_MSG):
+            sut.with_sticky_project_file(ABS_PATH)
 
+    @pytest.mark.windows
     @pytest.mark.skipif(os.name != "nt", reason="Windows-only quirk")
-    def test_drive_anchored_relative_is_not_allowed(self, sut):
-        msg = re.escape("must be a *relative* path from the project root")
-        with pytest.raises(ValueError, match=msg):
-            sut.with_sticky_project_file(Path("C:foo.txt"))
+    class TestWindowsQuirks:
 
+        def test_drive_anchored_relative_is_not_allowed(self, sut):
+            with pytest.raises(ValueError, match=NOT_RELATIVE_MSG):
+                sut.with_sticky_project_file(Path("C:foo.txt"))
 
-@pytest.fixture
-def rooted_sut() -> ProjectFileLocator:
-    root = ProjectFileLocator().get_project_root()
-    return ProjectFileLocator().with_project_root(root)
+
+@pytest.fixture(scope="module")
+def detected_root() -> Path:
+    """The marker search from CWD runs once per module; it does not change between tests."""
+    return ProjectFileLocator().get_project_root()
+
+
+@pytest.fixture(scope="class")
+def rooted_sut(detected_root) -> ProjectFileLocator:
+    return PROTO.with_project_root(detected_root)
 
 
 @pytest.mark.integration
@@ -231,15 +405,127 @@ class TestGetProjectFile:
 @pytest.mark.integration
 class TestGetProjectFileRelpathRootRestriction:
 
-    @pytest.fixture
-    def outside_relpath(self) -> Path:
-        return Path('..') / Path(__file__).name
-
-    def test_default_restricts_relpath_escape_from_root(self, rooted_sut, outside_relpath):
+    def test_default_restricts_relpath_escape_from_root(self, rooted_sut):
         # restrict_to_root=True by default
-        with pytest.raises(ValueError, match="Resolved path escapes project root"):
-            rooted_sut.get_project_file(relpath=outside_relpath)
+        with pytest.raises(ValueError, match=ESCAPES_ROOT_MSG):
+            rooted_sut.get_project_file(relpath=OUTSIDE_RELPATH)
 
-    def test_can_allow_relpath_escape_from_root(self, rooted_sut, outside_relpath):
+    def test_can_allow_relpath_escape_from_root(self, rooted_sut):
         with does_not_raise():
-            rooted_sut.get_project_file(relpath=outside_relpath, restrict_to_root=False, must_exist=False)
\ No newline at end of file
+            rooted_sut.get_project_file(relpath=OUTSIDE_RELPATH, restrict_to_root=False, must_exist=False)
+
+    def test_root_below_a_symlinked_folder_is_not_an_escape(self, tmp_path):
+        real = tmp_path / "real"
+        _seed_files(real, "proj/app.yaml")
+        link = tmp_path / "link"
+        try:
+            link.symlink_to(real, target_is_directory=True)
+        except OSError:
+            pytest.skip("symlinks are not available")
+
+        sut = PROTO.with_project_root(link / "proj")
+        assert sut.get_project_file("app.yaml") == (real / "proj" / "app.yaml").resolve()
+
+    def test_sibling_sharing_the_root_name_prefix_is_an_escape(self, tmp_path):
+        root = tmp_path / "proj"
+        root.mkdir()
+        sut = PROTO.with_project_root(root)
+        with pytest.raises(ValueError, match=ESCAPES_ROOT_MSG):
+            sut.get_project_file("../proj2/app.yaml", must_exist=False)
+
+
+@pytest.fixture(scope="session")
+def proj(tmp_path_factory) -> Path:
+    """A read-only project skeleton built once; tests that change files use proj_copy."""
+    root = tmp_path_factory.mktemp("proj")
+    _seed_files(root, "app.yaml", "cfg/app.yaml")
+    return root
+
+
+@pytest.fixture
+def proj_copy(proj, tmp_path) -> Path:
+    """A private copy of the skeleton for tests that write or delete files."""
+    return Path(shutil.copytree(proj, tmp_path / "proj"))
+
+
+@pytest.fixture
+def primed_sut(proj) -> ProjectFileLocator:
+    """A fresh locator per test whose sticky file is already resolved (and cached); cases may add entries."""
+    primed = PROTO.with_project_root(proj).with_sticky_project_file("app.yaml")
+    primed.get_project_file()
+    return primed
+
+
+@pytest.mark.integration
+class TestGetProjectFileCaching:
+
+    @pytest.fixture
+    def proj_sut(self, proj) -> ProjectFileLocator:
+        # a fresh locator (and so an empty cache) per test over the shared tree
+        return PROTO.with_project_root(proj).with_sticky_project_file("app.yaml")
+
+    @pytest.mark.parametrize("call_kwargs, expect_cached", [
+        ({}, True),  # default: the primed resolution is reused
+        ({"use_cache": False}, False),  # bypassed on request
+        ({"relpath": "other.yaml", "must_exist": False}, False),  # a different path is its own entry
+    ], ids=["default", "bypass", "other_relpath"])
+    def test_cache_modes(self, primed_sut, log_events, call_kwargs, expect_cached):
+        path = primed_sut.get_project_file(**call_kwargs)
+
+        assert path.name == Path(call_kwargs.get("relpath", "app.yaml")).name
+        assert ("cached resolution" in log_events) is expect_cached
+
+    def test_first_call_is_not_a_cache_hit(self, proj_sut, log_events):
+        proj_sut.get_project_file()
+        assert "cached resolution" not in log_events
+
+    def test_existence_is_checked_on_every_call(self, proj_copy):
+        sut = PROTO.with_project_root(proj_copy)
+        sut.get_project_file("cfg/app.yaml")
+        (proj_copy / "cfg" / "app.yaml").unlink()
+
+        with pytest.raises(FileNotFoundError):
+            sut.get_project_file("cfg/app.yaml")
+
+    def test_resolve_is_called_once_per_builder(self, proj_sut, monkeypatch):
+        calls = []
+        real_resolve = Path.resolve
+
+        def counting_resolve(self, *args, **kwargs):
+            calls.append(self)
+            return real_resolve(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "resolve", counting_resolve)
+        for _ in range(3):
+            proj_sut.get_project_file()
+
+        assert len(calls) == 1
+
+    def test_env_var_paths_are_not_cached(self, proj_sut, monkeypatch):
+        monkeypatch.setenv("EBF_TEST_CFG", "a.yaml")
+        assert proj_sut.get_project_file("$EBF_TEST_CFG", must_exist=False).name == "a.yaml"
+
+        monkeypatch.setenv("EBF_TEST_CFG", "b.yaml")
+        assert proj_sut.get_project_file("$EBF_TEST_CFG", must_exist=False).name == "b.yaml"
+
+    def test_cache_is_safe_to_share_across_threads(self, proj_sut):
+        names = [f"f{i}.yaml" for i in range(ProjectFileLocator.PROJECT_FILE_CACHE_SIZE * 2)]
+
+        def resolve_all(_):
+            return [proj_sut.get_project_file(name, must_exist=False).name for name in names]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(resolve_all, range(32)))
+
+        assert all(result == names for result in results)
+        assert len(proj_sut._file_cache) <= ProjectFileLocator.PROJECT_FILE_CACHE_SIZE
+
+    @pytest.mark.parametrize("clone", [copy.deepcopy, lambda loc: pickle.loads(pickle.dumps(loc))],
+                             ids=["deepcopy", "pickle"])
+    def test_primed_locator_can_be_copied(self, proj_sut, clone):
+        proj_sut.get_project_file()
+
+        copied = clone(proj_sut)
+
+        assert copied == proj_sut
+        assert copied.get_project_file() == proj_sut.get_project_file()
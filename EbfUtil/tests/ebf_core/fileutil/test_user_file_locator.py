@@ -1,43 +1,63 @@
 from pathlib import Path
-from typing import Generator, Callable
 
 import pytest
 
-from ebf_core.fileutil.user_file_locator import UserFileLocator
+from ebf_core.fileutil.user_file_locator import USER_FILES, UserFileLocator
 
+REAL_HOME = Path.home().resolve()
+DEFAULT_LOCATOR = UserFileLocator()
 
-@pytest.fixture
-def temp_user_home(tmp_path: Path) -> Generator[Path, None, None]:
+
+SAMPLE_FILES = (
+    "config.txt",
+    "existing.txt",
+    ".config/app/settings.yaml",
+    "docs/readme.md",
+    "projects/myapp/config.yml",
+    "data/export.csv",
+)
+
+
+def _put_file(home: Path, relative: str | Path, content: str = "") -> Path:
+    """Create a file under home and return its path (home is already resolved)."""
+    path = home / relative
+    try:
+        path.write_text(content, encoding="utf-8")
+    except FileNotFoundError:
+        # Only nested paths need their parents made.
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+    return path
+
+
+@pytest.fixture(scope="session")
+def temp_user_home(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """
-    Provides a temporary directory acting as the user's home.
-    All files created in tests go under this directory.
+    Provides an empty temporary directory acting as the user's home.
+    Tests against it must not write to it; it is shared across the session.
     """
-    home = tmp_path / "home"
-    home.mkdir()
-    yield home
+    return tmp_path_factory.mktemp("home")
+
+
+@pytest.fixture(scope="session")
+def sample_tree(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A fake home holding SAMPLE_FILES, built once per session and never modified."""
+    home = tmp_path_factory.mktemp("sample_home")
+    for relative in SAMPLE_FILES:
+        _put_file(home, relative, "content")
+    return home
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sut(temp_user_home: Path) -> UserFileLocator:
     """Standard UserFileLocator instance for testing."""
     return UserFileLocator.for_testing(temp_user_home)
 
 
-@pytest.fixture
-def put_file(temp_user_home: Path) -> Callable:
-    """
-    Helper to easily create files under the fake home.
-
-    Returns a function: put_file("relative/path.txt", "content") -> Path
-    """
-
-    def _put(relative: str | Path, content: str = "") -> Path:
-        path = temp_user_home / relative
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(content, encoding="utf-8")
-        return path.resolve()
-
-    return _put
+@pytest.fixture(scope="session")
+def sut_ro(sample_tree: Path) -> UserFileLocator:
+    """Read-only UserFileLocator over sample_tree."""
+    return UserFileLocator.for_testing(sample_tree)
 
 
 class TestUserFileLocator:
@@ -48,18 +68,15 @@ class TestUserFileLocator:
 
         def test_home_defaults_to_path_home(self):
             """Without override, home should be Path.home()."""
-            locator = UserFileLocator()
-            assert locator.home == Path.home().resolve()
-
-        def test_can_override_home_via_for_testing(self, tmp_path):
-            """for_testing() should set a custom home directory."""
-            locator = UserFileLocator.for_testing(tmp_path)
-            assert locator.home == tmp_path.resolve()
+            assert DEFAULT_LOCATOR.home == REAL_HOME
 
-        def test_can_override_home_via_constructor(self, tmp_path):
-            """Direct constructor call should also allow override."""
-            locator = UserFileLocator(tmp_path)
-            assert locator.home == tmp_path.resolve()
+        @pytest.mark.parametrize(
+            "ctor", [UserFileLocator.for_testing, UserFileLocator], ids=["for_testing", "constructor"]
+        )
+        def test_can_override_home(self, ctor, tmp_path):
+            """Both for_testing() and the direct constructor should set a custom home directory."""
+            locator = ctor(tmp_path)
+            assert locator.home == tmp_path
 
         def test_home_is_always_resolved(self, tmp_path):
             """Home path should always be absolute and resolved."""
@@ -70,40 +87,32 @@ class TestUserFileLocator:
     class TestFile:
         """Tests for the file() method - constructing paths under home."""
 
-        def test_single_string_part(self, sut, put_file):
+        def test_single_string_part(self, sut_ro):
             """Should construct a path from a single string part."""
-            put_file("config.txt", "content")
-
-            path = sut.file("config.txt")
+            path = sut_ro.file("config.txt")
 
             assert path.name == "config.txt"
-            assert path.parent == sut.home
+            assert path.parent == sut_ro.home
             assert path.exists()
 
-        def test_multiple_string_parts(self, sut, put_file):
+        def test_multiple_string_parts(self, sut_ro):
             """Should construct a path from multiple string parts."""
-            put_file(".config/app/settings.yaml", "content")
-
-            path = sut.file(".config", "app", "settings.yaml")
+            path = sut_ro.file(".config", "app", "settings.yaml")
 
             assert path.name == "settings.yaml"
             assert path.parent.name == "app"
             assert path.exists()
 
-        def test_path_object_as_part(self, sut, put_file):
+        def test_path_object_as_part(self, sut_ro):
             """Should accept Path objects as parts."""
-            put_file("docs/readme.md", "content")
-
-            path = sut.file(Path("docs"), Path("readme.md"))
+            path = sut_ro.file(Path("docs"), Path("readme.md"))
 
             assert path.name == "readme.md"
             assert path.exists()
 
-        def test_mixed_string_and_path_parts(self, sut, put_file):
+        def test_mixed_string_and_path_parts(self, sut_ro):
             """Should accept a mix of strings and Path objects."""
-            put_file("projects/myapp/config.yml", "content")
-
-            path = sut.file("projects", Path("myapp"), "config.yml")
+            path = sut_ro.file("projects", Path("myapp"), "config.yml")
 
             assert path.name == "config.yml"
             assert path.exists()
@@ -132,11 +141,11 @@ class TestUserFileLocator:
     class TestTryFile:
         """Tests for the try_file() method - existence-checking variant."""
 
-        def test_returns_path_when_file_exists(self, sut, put_file):
+        def test_returns_path_when_file_exists(self, sut_ro, sample_tree):
             """Should return a path when the file exists."""
-            expected = put_file("existing.txt", "content")
+            expected = sample_tree / "existing.txt"
 
-            result = sut.try_file("existing.txt")
+            result = sut_ro.try_file("existing.txt")
 
             assert result == expected
             assert result.exists()
@@ -147,28 +156,26 @@ class TestUserFileLocator:
 
             assert result is None
 
-        def test_works_with_nested_paths(self, sut, put_file):
+        def test_works_with_nested_paths(self, sut_ro, sample_tree):
             """Should work with nested directory structures."""
-            expected = put_file(".config/app/settings.yaml", "content")
+            expected = sample_tree / ".config" / "app" / "settings.yaml"
 
-            result = sut.try_file(".config", "app", "settings.yaml")
+            result = sut_ro.try_file(".config", "app", "settings.yaml")
 
             assert result == expected
 
-        def test_missing_nested_path_returns_none(self, sut, put_file):
+        def test_missing_nested_path_returns_none(self, sut_ro):
             """Should return None for missing nested paths."""
-            # Create the parent dir but not the file
-            (sut.home / ".config" / "app").mkdir(parents=True)
-
-            result = sut.try_file(".config", "app", "missing.yaml")
+            # sample_tree has the parent dir but not the file
+            result = sut_ro.try_file(".config", "app", "missing.yaml")
 
             assert result is None
 
-        def test_accepts_path_objects(self, sut, put_file):
+        def test_accepts_path_objects(self, sut_ro, sample_tree):
             """Should accept Path objects as arguments."""
-            expected = put_file("data/export.csv", "content")
+            expected = sample_tree / "data" / "export.csv"
 
-            result = sut.try_file(Path("data"), Path("export.csv"))
+            result = sut_ro.try_file(Path("data"), Path("export.csv"))
 
             assert result == expected
 
@@ -177,19 +184,14 @@ class TestUserFilesGlobalSingleton:
     """Tests for the USER_FILES global singleton."""
 
     def test_global_singleton_exists(self):
-        """USER_FILES should be importable and usable."""
-        from ebf_core.fileutil.user_file_locator import USER_FILES
-
+        """USER_FILES should be a usable UserFileLocator."""
         assert isinstance(USER_FILES, UserFileLocator)
-        assert USER_FILES.home == Path.home().resolve()
+        assert USER_FILES.home == REAL_HOME
 
     def test_global_singleton_is_production_ready(self):
         """USER_FILES should use the real home directory."""
-        from ebf_core.fileutil.user_file_locator import USER_FILES
-
         # Should not have an override
         assert USER_FILES._override_home is None
 
         # Should point to real home
-        path = USER_FILES.file(".bashrc")
-        assert path.parent == Path.home().resolve()
\ No newline at end of file
+        assert USER_FILES.home == REAL_HOME
\ No newline at end of file
@@ -26,17 +26,18 @@ class TestPluralizeWord:
         assert pluralize_word(5, "cat") == "cats"
 
     def test_irregular_nouns(self) -> None:
-        assert pluralize_word(1, "child") == "child"
-        assert pluralize_word(3, "child") == "children"
-
-        assert pluralize_word(1, "person") == "person"
-        assert pluralize_word(10, "person") == "people"
-
-        assert pluralize_word(1, "sheep") == "sheep"
-        assert pluralize_word(100, "sheep") == "sheep"
-
-        assert pluralize_word(1, "mouse") == "mouse"
-        assert pluralize_word(99, "mouse") == "mice"
+        cases = [
+            (1, "child", "child"),
+            (3, "child", "children"),
+            (1, "person", "person"),
+            (10, "person", "people"),
+            (1, "sheep", "sheep"),
+            (100, "sheep", "sheep"),
+            (1, "mouse", "mouse"),
+            (99, "mouse", "mice"),
+        ]
+        for count, word, expected in cases:
+            assert pluralize_word(count, word) == expected, f"{count} x {word}"
 
     def test_with_show_count(self) -> None:
         assert pluralize_word(1, "dog", show_count=True) == "1 dog"
@@ -1,4 +1,6 @@
 import copy
+import gc
+import re
 import weakref
 from dataclasses import dataclass
 
@@ -6,6 +8,14 @@ import pytest
 from src.ebf_core.guards.guards import ContractError
 from src.ebf_core.reflection.attr_reflector import AttributeReflector
 
+INVALID_ATTR_PATH_MSG = re.compile(re.escape("Arg 'attr_path' cannot be"))
+
+
+@pytest.fixture(scope="class")
+def sut_ro(request) -> AttributeReflector:
+    """A reflector over one RO_TARGET instance, shared by the class's tests that only read from it."""
+    return AttributeReflector(request.cls.RO_TARGET())
+
 
 class TestSimpleAttr:
     """Tests for basic get/set operations on simple attributes."""
@@ -15,6 +25,8 @@ class TestSimpleAttr:
             self.attr = "original_value"
             self.nested_attr = "original_value"  # for the combined test
 
+    RO_TARGET = SimpleClass
+
     @pytest.fixture
     def simple_obj(self) -> object:
         return TestSimpleAttr.SimpleClass()
@@ -23,12 +35,12 @@ class TestSimpleAttr:
     def sut(self, simple_obj) -> AttributeReflector:
         return AttributeReflector(simple_obj)
 
-    def test_has_attr(self, sut):
-        assert sut.has_attr("attr")
-        assert not sut.has_attr("not_an_attr")
+    def test_has_attr(self, sut_ro):
+        assert sut_ro.has_attr("attr")
+        assert not sut_ro.has_attr("not_an_attr")
 
-    def test_can_get_value(self, sut):
-        assert sut.get_value("attr") == "original_value"
+    def test_can_get_value(self, sut_ro):
+        assert sut_ro.get_value("attr") == "original_value"
 
     def test_can_set_value(self, sut, simple_obj: SimpleClass):
         sut.set_value("attr", "new_value")
@@ -49,10 +61,10 @@ class TestSimpleAttr:
 
     @pytest.mark.parametrize("illegal_arg", [None, "", "  "])
     def test_non_existent_attribute_spec_raises_error(self, sut, illegal_arg):
-        with pytest.raises(ContractError):
+        with pytest.raises(ContractError, match=INVALID_ATTR_PATH_MSG):
             sut.get_value(illegal_arg)
 
-        with pytest.raises(ContractError):
+        with pytest.raises(ContractError, match=INVALID_ATTR_PATH_MSG):
             sut.set_value(illegal_arg, "blah")
 
 
@@ -75,6 +87,8 @@ class TestNestedAttrs:
             self.name = "child"
             self.ancestor = TestNestedAttrs.ParentClass()
 
+    RO_TARGET = ChildClass
+
     @pytest.fixture
     def ancestor(self) -> object:
         return TestNestedAttrs.GrandparentClass()
@@ -91,14 +105,14 @@ class TestNestedAttrs:
     def sut(self, child) -> AttributeReflector:
         return AttributeReflector(child)
 
-    def test_has_attr(self, sut):
-        assert sut.has_attr("ancestor.ancestor.name")
-        assert not sut.has_attr("ancestor.not_an_attr")
+    def test_has_attr(self, sut_ro):
+        assert sut_ro.has_attr("ancestor.ancestor.name")
+        assert not sut_ro.has_attr("ancestor.not_an_attr")
 
-    def test_get_value(self, sut, child: ChildClass):
-        assert sut.get_value("name") == "child"
-        assert sut.get_value("ancestor.name") == "parent"
-        assert sut.get_value("ancestor.ancestor.name") == "grandpa"
+    def test_get_value(self, sut_ro):
+        assert sut_ro.get_value("name") == "child"
+        assert sut_ro.get_value("ancestor.name") == "parent"
+        assert sut_ro.get_value("ancestor.ancestor.name") == "grandpa"
 
     def test_set_value(self, sut, child: ChildClass):
         assert sut.get_value("ancestor.ancestor.name") == "grandpa"
@@ -114,6 +128,8 @@ class TestDictionaryAttr:
         def __init__(self):
             self.dict_attr = {"key1": 22, "key2": 33}
 
+    RO_TARGET = MyClass
+
     @pytest.fixture
     def obj_with_dict(self) -> object:
         return TestDictionaryAttr.MyClass()
@@ -122,13 +138,13 @@ class TestDictionaryAttr:
     def sut(self, obj_with_dict) -> AttributeReflector:
         return AttributeReflector(obj_with_dict)
 
-    def test_has_attr(self, sut):
-        assert sut.has_attr("dict_attr.key1")
-        assert not sut.has_attr("dict_attr.key99")
+    def test_has_attr(self, sut_ro):
+        assert sut_ro.has_attr("dict_attr.key1")
+        assert not sut_ro.has_attr("dict_attr.key99")
 
-    def test_get_value(self, sut):
-        assert sut.get_value("dict_attr.key1") == 22
-        assert sut.get_value("dict_attr.key2") == 33
+    def test_get_value(self, sut_ro):
+        assert sut_ro.get_value("dict_attr.key1") == 22
+        assert sut_ro.get_value("dict_attr.key2") == 33
 
     def test_set_value(self, sut):
         assert sut.get_value("dict_attr.key1") == 22
@@ -145,6 +161,8 @@ class TestListAttr:
         def __init__(self):
             self.list_attr = [1, 2, 3]
 
+    RO_TARGET = MyClass
+
     @pytest.fixture
     def obj_with_list(self) -> object:
         return TestListAttr.MyClass()
@@ -153,14 +171,14 @@ class TestListAttr:
     def sut(self, obj_with_list) -> AttributeReflector:
         return AttributeReflector(obj_with_list)
 
-    def test_has_attr(self, sut):
-        assert sut.has_attr("list_attr.0")
-        assert not sut.has_attr("list_attr.99")
+    def test_has_attr(self, sut_ro):
+        assert sut_ro.has_attr("list_attr.0")
+        assert not sut_ro.has_attr("list_attr.99")
 
-    def test_get_value(self, sut):
-        assert sut.get_value("list_attr.0") == 1
-        assert sut.get_value("list_attr.1") == 2
-        assert sut.get_value("list_attr.2") == 3
+    def test_get_value(self, sut_ro):
+        assert sut_ro.get_value("list_attr.0") == 1
+        assert sut_ro.get_value("list_attr.1") == 2
+        assert sut_ro.get_value("list_attr.2") == 3
 
     def test_set_value(self, sut, obj_with_list):
         assert sut.get_value("list_attr.1") == 2
@@ -170,6 +188,54 @@ class TestListAttr:
         assert sut.get_value("list_attr") == [1, 99, 3]
 
 
+class TestCachedHasAttr:
+    """Tests for the opt-in cache_has_attr mode."""
+
+    class MyClass:
+        def __init__(self):
+            self.attr = "value"
+
+    @pytest.fixture
+    def obj(self) -> object:
+        return TestCachedHasAttr.MyClass()
+
+    @pytest.fixture
+    def sut(self, obj) -> AttributeReflector:
+        return AttributeReflector(obj, cache_has_attr=True)
+
+    def test_has_attr_answers_are_remembered(self, sut, obj):
+        assert not sut.has_attr("extra")
+        obj.extra = 1  # changed behind the reflector's back, so the cached answer stands
+        assert not sut.has_attr("extra")
+
+    def test_set_value_forgets_cached_answers(self, sut, obj):
+        assert not sut.has_attr("extra")
+        obj.extra = 1
+        sut.set_value("attr", "new_value")
+        assert sut.has_attr("extra")
+
+    def test_get_value_reads_live_values(self, sut, obj):
+        assert sut.get_value("attr") == "value"
+        obj.attr = "changed"
+        assert sut.get_value("attr") == "changed"
+
+    def test_get_value_sees_collected_weak_method(self, sut):
+        target = TestWeakMethodReferences.MyClass()
+        sut.set_value("attr", weakref.WeakMethod(target.my_method))
+        assert sut.get_value("attr")[0] == "__weakmethod__"
+
+        del target
+        gc.collect()
+
+        assert sut.get_value("attr") is None
+
+    def test_not_cached_by_default(self, obj):
+        sut = AttributeReflector(obj)
+        assert not sut.has_attr("extra")
+        obj.extra = 1
+        assert sut.has_attr("extra")
+
+
 class TestWeakMethodReferences:
     """Tests for handling weak method references."""
 
@@ -261,43 +327,42 @@ class TestDataclassSupport:
 class TestMixedComplexObjects:
     """Tests for complex nested scenarios mixing different types."""
 
-    def test_mixed_dict_list_object_nesting(self):
-        """Test accessing deeply nested structures with mixed types."""
+    class InnerClass:
+        def __init__(self):
+            self.value = "deep_value"
 
-        class InnerClass:
-            def __init__(self):
-                self.value = "deep_value"
+    class Item:
+        def __init__(self, name):
+            self.name = name
 
-        obj = {
+    class Container:
+        def __init__(self):
+            self.items = [TestMixedComplexObjects.Item(n) for n in ("first", "second", "third")]
+
+    RO_TARGET = Container
+
+    def test_mixed_dict_list_object_nesting(self):
+        """Test accessing deeply nested structures with mixed types."""
+        sut = AttributeReflector({
             "level1": {
                 "level2": [
-                    {"item": InnerClass()}
+                    {"item": TestMixedComplexObjects.InnerClass()}
                 ]
             }
-        }
-
-        sut = AttributeReflector(obj)
-
+        })
         result = sut.get_value("level1.level2.0.item.value")
         assert result == "deep_value"
 
-    def test_list_of_objects_access(self):
+    def test_list_of_objects_access(self, sut_ro):
         """Test accessing objects within a list."""
+        assert sut_ro.get_value("items.0.name") == "first"
+        assert sut_ro.get_value("items.1.name") == "second"
+        assert sut_ro.get_value("items.2.name") == "third"
 
-        class Item:
-            def __init__(self, name):
-                self.name = name
-
-        class Container:
-            def __init__(self):
-                self.items = [Item("first"), Item("second"), Item("third")]
-
-        obj = Container()
+    def test_list_of_objects_set_value(self):
+        """Test setting an attribute on an object within a list."""
+        obj = TestMixedComplexObjects.Container()
         sut = AttributeReflector(obj)
 
-        assert sut.get_value("items.0.name") == "first"
-        assert sut.get_value("items.1.name") == "second"
-        assert sut.get_value("items.2.name") == "third"
-
         sut.set_value("items.1.name", "modified")
         assert obj.items[1].name == "modified"